@@ -23,5 +23,5 @@ setup(
     packages=find_packages(),
     include_package_data=True,
     python_requires='>=3.6',
-    install_requires=['more_itertools']
+    install_requires=[]
 )
\ No newline at end of file
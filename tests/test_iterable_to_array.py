@@ -0,0 +1,84 @@
+import random
+from array import array
+
+import pytest
+
+import toarray.iterable_to_array as ita
+from toarray import get_array
+
+
+@pytest.mark.parametrize('values, type_code', [
+    ([0, 255], 'B'),
+    ([0, 256], 'H'),
+    ([0, 65535], 'H'),
+    ([0, 65536], 'I'),
+    ([-128, 127], 'b'),
+    ([-129, 0], 'h'),
+    ([-1, 128], 'h'),
+    ([-32768, 32767], 'h'),
+    ([-32769, 0], 'i'),
+    ([-1, 32768], 'i'),
+    ([0, 2**32 - 1], 'I'),
+    ([0, 2**32], 'L'),
+    ([-2**31, 2**31 - 1], 'i'),
+    ([-2**31 - 1, 0], 'l'),
+    ([0, 2**63], 'L'),
+    ([-2**63, 2**63 - 1], 'l'),
+])
+def test_narrowest_int_type(values, type_code):
+    if type_code in 'Ll' and array(type_code).itemsize < 8:
+        pytest.skip('C long is 32 bits on this platform')
+    result = get_array(values)
+    assert result.typecode == type_code
+    assert result.tolist() == values
+
+
+def test_int_past_widest_type_is_not_int_array():
+    result = get_array([0, 2**64])
+    assert not isinstance(result, array) or result.typecode not in 'bBhHiIlL'
+
+
+def _same(a, b):
+    return type(a) is type(b) and getattr(a, 'typecode', None) == getattr(b, 'typecode', None) and a == b
+
+
+@pytest.mark.parametrize('tail', [[], [-1], [300], [70000], [1.5], ['x'], [-2**40]])
+def test_sample_path_matches_full_scan(tail, monkeypatch):
+    random.seed(0)
+    values = [random.randint(0, 200) for _ in range(ita.SAMPLE_SIZE * 2)] + tail
+    sampled = get_array(values)
+    # a sample larger than the input forces the full scan
+    monkeypatch.setattr(ita, 'SAMPLE_SIZE', len(values) + 1)
+    assert _same(sampled, get_array(values))
+
+
+class Index:
+    """int-like but not a numbers.Number"""
+    def __init__(self, n):
+        self.n = n
+
+    def __index__(self):
+        return self.n
+
+
+@pytest.mark.parametrize('length', [10, ita.SAMPLE_SIZE * 2])
+def test_index_only_values_are_not_numeric(length):
+    result = get_array(list(range(length)) + [Index(3)])
+    assert isinstance(result, list)
+
+
+@pytest.mark.parametrize('r', [
+    range(100), range(300, -5, -3), range(-2**40, 2**40, 2**38), range(0, 2**70, 2**68),
+])
+def test_range_path_matches_list(r):
+    assert _same(get_array(r), get_array(list(r)))
+
+
+def test_masked_numpy_array_uses_general_path():
+    np = pytest.importorskip('numpy')
+    result = get_array(np.ma.array([1, 1000, 2], mask=[0, 1, 0]))
+    assert isinstance(result, list)
+    assert result[0] == 1 and result[1] is np.ma.masked and result[2] == 2
+    result = get_array(np.ma.array([1.5, 2.5], mask=[0, 1]))
+    assert isinstance(result, list)
+    assert result[1] is np.ma.masked
@@ -1,8 +1,13 @@
 from array import array
-from numbers import Number
-from typing import Iterable, Union
+from itertools import islice
+from numbers import Integral, Number
+from operator import index
+from typing import Iterable, Optional, Sequence, Tuple, Union
 
-from more_itertools import minmax
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 def is_array_type(iterable: Iterable, type_code: str):
@@ -16,84 +21,221 @@ def all_numeric(iterable: Iterable) -> bool:
     return all(isinstance(x, Number) for x in iterable)
 
 
+# (smallest abs min, largest max) accepted for float and double arrays
+_FLOAT_RANGE = (1.2E-38, 3.4E+38)
+_DOUBLE_RANGE = (2.3E-308, 1.7E+308)
+
+
 def is_float_array(iterable: Iterable, min_max: tuple) -> bool:
     min_num, max_num = min_max
-    return (abs(min_num) >= 1.2E-38 and max_num <= 3.4E+38)
+    return (abs(min_num) >= _FLOAT_RANGE[0] and max_num <= _FLOAT_RANGE[1])
 
 
 def is_double_array(iterable: Iterable, min_max: tuple) -> bool:
     min_num, max_num = min_max
-    return (abs(min_num) >= 2.3E-308 and max_num <= 1.7E+308)
+    return (abs(min_num) >= _DOUBLE_RANGE[0] and max_num <= _DOUBLE_RANGE[1])
 
 
 def is_string_array(iterable: Iterable):
     return is_array_type(iterable, 'u')
 
 
-def get_array(iterable: Iterable) -> Union[array, list]:
-    """find C array type and return array
-       If no C type is found, return list
+def _codes_by_bit_length(codes: tuple, sign_bits: int) -> tuple:
+    """narrowest code in codes for each value bit length, None past the widest"""
+    widths = [array(code).itemsize * 8 - sign_bits for code in codes]
+    return tuple(next((code for code, width in zip(codes, widths) if width >= n), None)
+                 for n in range(max(widths) + 2))
+
+
+# int type codes from narrowest to widest.
+# Sizes come from the platform, so 'L' is 4 bytes on Windows and 8 on Linux.
+_UNSIGNED_CODES = ('B', 'H', 'I', 'L')
+_SIGNED_CODES = ('b', 'h', 'i', 'l')
+# narrowest code indexed by int.bit_length() of the largest magnitude;
+# signed codes lose one bit to the sign.
+_UNSIGNED_BY_BITS = _codes_by_bit_length(_UNSIGNED_CODES, 0)
+_SIGNED_BY_BITS = _codes_by_bit_length(_SIGNED_CODES, 1)
+
+# numpy dtype matching each numeric type code, built once at import
+if np is not None:
+    _NUMPY_DTYPES = {code: np.dtype(code) for code in _UNSIGNED_CODES + _SIGNED_CODES + ('f', 'd')}
+
+
+def pick_int_type(min_num: int, max_num: int) -> Optional[str]:
+    """find narrowest int type code that holds min_num to max_num
+       Unsigned types are preferred for non-negative values.
+       Returns None if no int type fits.
     """
-    iterable = list(iterable)
-    if len(iterable) == 0:
-        print('empty iterable')
-        return []
-    
-    # check for unicode type
-    a = is_array_type(iterable, 'u')
-    if a: return a
+    min_num, max_num = index(min_num), index(max_num)
+    if min_num >= 0:
+        bits, table = max_num.bit_length(), _UNSIGNED_BY_BITS
+    else:
+        # ~n is -n - 1, the magnitude a negative n needs beside the sign bit
+        bits, table = (~min_num).bit_length(), _SIGNED_BY_BITS
+        if max_num > 0:
+            bits = max(bits, max_num.bit_length())
+    return table[min(bits, len(table) - 1)]
+
+
+def pick_float_type(min_max: tuple) -> Optional[str]:
+    """return 'f' or 'd' if min and max fit, else None"""
+    min_num, max_num = min_max
+    for type_code, (smallest, largest) in (('f', _FLOAT_RANGE), ('d', _DOUBLE_RANGE)):
+        if abs(min_num) >= smallest and max_num <= largest:
+            return type_code
+    return None
+
+
+def scan_numeric(iterable: Iterable) -> Optional[Tuple[Number, Number, bool]]:
+    """scan values once for min, max and whether all are integers
+       Returns None if any value is not numeric.
+    """
+    it = iter(iterable)
+    lo = hi = next(it)
+    if not isinstance(lo, Number):
+        return None
+    all_int = isinstance(lo, Integral)
+    for x in it:
+        # exact int and float skip the much slower abc isinstance checks
+        t = type(x)
+        if t is int:
+            pass
+        elif t is float:
+            all_int = False
+        elif not isinstance(x, Number):
+            return None
+        elif all_int and not isinstance(x, Integral):
+            all_int = False
+        if x < lo:
+            lo = x
+        elif x > hi:
+            hi = x
+    return lo, hi, all_int
+
+
+# number of leading values used to guess the int type of long inputs
+SAMPLE_SIZE = 128
+
+
+def sample_int_array(iterable: Sequence, sample_size: int = SAMPLE_SIZE):
+    """guess int type from the first sample_size values and build array
+       array() checks every value's range in C, so a wrong guess returns
+       False instead of a wrong array. array() also takes any object with
+       __index__, so value types are checked too, as the full scan does.
+    """
+    scanned = scan_numeric(islice(iterable, sample_size))
+    if scanned is None:
+        return False
+    min_num, max_num, all_int = scanned
+    if not all_int:
+        return False
+    type_code = pick_int_type(min_num, max_num)
+    if not type_code:
+        return False
+    a = is_array_type(iterable, type_code)
+    if a and not all(issubclass(t, Number) for t in set(map(type, iterable))):
+        return False
+    return a
+
+
+def get_numpy_array(iterable: 'np.ndarray') -> Union[array, list, None]:
+    """find C array type for 1d numeric numpy array using numpy min and max
+       Returns None if the array needs the general path.
+    """
+    if iterable.ndim != 1 or iterable.size == 0 or iterable.dtype.kind not in 'iuf':
+        return None
+    # masked min and max skip masked values, but the buffer copy would not
+    if np.ma.isMaskedArray(iterable):
+        return None
+    min_num, max_num = iterable.min().item(), iterable.max().item()
+    # nan compares unordered, leave it to the general path
+    if min_num != min_num or max_num != max_num:
+        return None
     
-    # check if all values are numeric
-    if not all_numeric(iterable):
+    type_code = None
+    if iterable.dtype.kind in 'iu':
+        type_code = pick_int_type(min_num, max_num)
+    if not type_code:
+        type_code = pick_float_type((min_num, max_num))
+    if not type_code:
         return list(iterable)
+    # copy straight from the numpy buffer, cast only if dtype differs.
+    # The cast is unchecked and wraps out-of-range values, so it is only
+    # safe because min and max above cover every element copied; the
+    # masked array check keeps hidden values from slipping past them.
+    a = array(type_code)
+    a.frombytes(memoryview(np.ascontiguousarray(iterable, dtype=_NUMPY_DTYPES[type_code])).cast('B'))
+    return a
+
+
+def get_array_array(iterable: array) -> Union[array, list, None]:
+    """find C array type for numeric array.array using builtin min and max
+       Values are known numeric, so no per-value type check is needed.
+       Returns None if the array needs the general path.
+    """
+    if len(iterable) == 0 or iterable.typecode not in 'bBhHiIlLqQfd':
+        return None
+    min_num, max_num = min(iterable), max(iterable)
+    # nan compares unordered, leave it to the general path
+    if min_num != min_num or max_num != max_num:
+        return None
     
-    # check for unsigned char type
-    a = is_array_type(iterable, 'B')
-    # Fits int 0 to 255.
-    if a: return a
-    
-    # check for signed char type
-    a = is_array_type(iterable, 'b')
-    # Fits int -128 to 128.
-    if a: return a
-    
-    # check for unsigned int type
-    # Fits int 0 to 4,294,967,295.
-    a = is_array_type(iterable, 'I')
-    if a: return a
+    type_code = None
+    if iterable.typecode not in 'fd':
+        type_code = pick_int_type(min_num, max_num)
+    if not type_code:
+        type_code = pick_float_type((min_num, max_num))
+    if not type_code:
+        return list(iterable)
+    # same type code copies the buffer directly
+    return array(type_code, iterable)
+
+
+def get_array(iterable: Iterable) -> Union[array, list]:
+    """find C array type and return array
+       If no C type is found, return list
+    """
+    if np is not None and isinstance(iterable, np.ndarray):
+        a = get_numpy_array(iterable)
+        if a is not None: return a
     
-    # check for int type
-    # Fits int -2,147,483,648 to 2,147,483,647.
-    a = is_array_type(iterable, 'i')
-    if a: return a
+    if isinstance(iterable, array):
+        a = get_array_array(iterable)
+        if a is not None: return a
     
-    # check for unsigned short type
-    a = is_array_type(iterable, 'H')
-    # Fits int 0 to 65,535.
-    if a: return a
+    # range min and max are its end values, no scan needed
+    if isinstance(iterable, range) and len(iterable) > 0:
+        ends = iterable[0], iterable[-1]
+        type_code = pick_int_type(min(ends), max(ends))
+        if type_code: return array(type_code, iterable)
     
-    # check for short type
-    a = is_array_type(iterable, 'h')
-    # Fits int -32,768 to 32,767.
-    if a: return a
+    # lists and tuples are checked in place, copied only if a list is returned
+    values = iterable if isinstance(iterable, (list, tuple)) else list(iterable)
+    if len(values) == 0:
+        print('empty iterable')
+        return []
     
-    # check for unsigned long type
-    a = is_array_type(iterable, 'L')
-    # Fits int 0 to 18,446,744,073,709,551,615.
+    # check for unicode type
+    a = is_array_type(values, 'u')
     if a: return a
     
-    # check for long type
-    a = is_array_type(iterable, 'l')
-    # Fits int -9,223,372,036,854,775,808 to 9,223,372,036,854,775,807.
-    if a: return a
+    # long int inputs are usually settled by a sample
+    if len(values) > SAMPLE_SIZE:
+        a = sample_int_array(values)
+        if a: return a
     
-    # check for float type
-    min_max = minmax(iterable)
-    if is_float_array(iterable, min_max):
-        return array('f', iterable)
-        
-    # check for double type
-    if is_double_array(iterable, min_max):
-        return array('d', iterable)
+    # check if all values are numeric, finding min and max in the same pass
+    type_code = None
+    scanned = scan_numeric(values)
+    if scanned is not None:
+        min_num, max_num, all_int = scanned
+        # pick the narrowest int type that holds min and max
+        if all_int:
+            type_code = pick_int_type(min_num, max_num)
+        if not type_code:
+            type_code = pick_float_type((min_num, max_num))
+    if type_code:
+        return array(type_code, values)
     
-    return list(iterable)
\ No newline at end of file
+    # no C type fits, return a list not shared with the caller
+    return values if values is not iterable else list(values)